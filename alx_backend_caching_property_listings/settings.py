@@ -137,8 +137,12 @@ CACHES = {
         'LOCATION': 'redis://localhost:6379/1',  # Use 'redis://redis:6379/1' when running Django in Docker
         'OPTIONS': {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'SERIALIZER': 'django_redis.serializers.msgpack.MSGPackSerializer',
+            'CONNECTION_POOL_KWARGS': {'max_connections': 50},
         },
-        'KEY_PREFIX': 'property_listings',
+        # New prefix for the msgpack serializer so entries pickled under the
+        # old 'property_listings' prefix (including sessions) are never decoded
+        'KEY_PREFIX': 'property_listings_msgpack',
         'TIMEOUT': 300,  # 5 minutes default timeout
     }
 }
@@ -162,5 +166,10 @@ LOGGING = {
             'level': 'INFO',
             'propagate': True,
         },
+        'properties.signals': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': True,
+        },
     },
 }
\ No newline at end of file
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.4 on 2026-10-15 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['-created_at'], name='property_created_at_idx'),
+        ),
+    ]
@@ -12,4 +12,7 @@ class Property(models.Model):
         return self.title
     
     class Meta:
-        verbose_name_plural = "Properties"
\ No newline at end of file
+        verbose_name_plural = "Properties"
+        indexes = [
+            models.Index(fields=['-created_at'], name='property_created_at_idx'),
+        ]
\ No newline at end of file
@@ -1,22 +1,56 @@
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from django.core.cache import cache
 from .models import Property
+from .utils import invalidate_properties_cache
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Per-thread flag marking that the current commit already invalidated
+_invalidation_state = threading.local()
+
+
+def _run_scheduled_invalidation():
+    """
+    on_commit callback that invalidates the caches once per commit.
+    
+    Every write queues this callback; the first one to run after a commit
+    invalidates and the rest of that commit's callbacks are skipped.
+    """
+    if getattr(_invalidation_state, 'done', False):
+        return
+    
+    _invalidation_state.done = True
+    invalidate_properties_cache()
+
+
+def schedule_properties_cache_invalidation():
+    """
+    Invalidate the property list caches once the current transaction commits.
+    
+    Writes inside one atomic block are coalesced into a single invalidation.
+    Outside a transaction the callback runs immediately.
+    """
+    # A new write re-arms invalidation for the commit it belongs to
+    _invalidation_state.done = False
+    transaction.on_commit(_run_scheduled_invalidation)
 
 
 @receiver(post_save, sender=Property)
 def invalidate_property_cache_on_save(sender, instance, **kwargs):
     """
-    Invalidate the all_properties cache when a Property is created or updated.
+    Invalidate the property list caches when a Property is created or updated.
     """
-    cache.delete('all_properties')
-    print(f"Cache invalidated after Property {instance.id} was saved")
+    schedule_properties_cache_invalidation()
+    logger.info(f"Cache invalidation scheduled after Property {instance.id} was saved")
 
 
 @receiver(post_delete, sender=Property)
 def invalidate_property_cache_on_delete(sender, instance, **kwargs):
     """
-    Invalidate the all_properties cache when a Property is deleted.
+    Invalidate the property list caches when a Property is deleted.
     """
-    cache.delete('all_properties')
-    print(f"Cache invalidated after Property {instance.id} was deleted")
\ No newline at end of file
+    schedule_properties_cache_invalidation()
+    logger.info(f"Cache invalidation scheduled after Property {instance.id} was deleted")
@@ -1,3 +1,233 @@
-from django.test import TestCase
+import gzip
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+import fakeredis
+import orjson
+from django.test import RequestFactory, TestCase, override_settings
+from django.db import transaction
+from django.utils import timezone
+
+from . import utils, views
+from .models import Property
+
+# In-memory Redis shared by every cache connection in the tests
+FAKE_REDIS_SERVER = fakeredis.FakeServer()
+
+TEST_CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': 'redis://localhost:6379/1',
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'SERIALIZER': 'django_redis.serializers.msgpack.MSGPackSerializer',
+            'CONNECTION_POOL_KWARGS': {
+                'connection_class': fakeredis.FakeConnection,
+                'server': FAKE_REDIS_SERVER,
+            },
+        },
+        'KEY_PREFIX': 'property_listings_test',
+    }
+}
+
+
+@override_settings(CACHES=TEST_CACHES)
+class PropertyCacheTestCase(TestCase):
+    """
+    Base test case running against a fresh fake Redis and in-process cache.
+    """
+
+    def setUp(self):
+        utils._redis_client = None
+        utils._local_cache.clear()
+        utils._get_redis().flushdb()
+
+    def create_property(self, title, minutes_ago=0):
+        property_obj = Property.objects.create(
+            title=title,
+            description=f'{title} description',
+            price=Decimal('1000.00'),
+            location='Casablanca',
+        )
+        # created_at is auto_now_add, so set it explicitly for ordering
+        Property.objects.filter(pk=property_obj.pk).update(
+            created_at=timezone.now() - timedelta(minutes=minutes_ago)
+        )
+        return property_obj
+
+
+class VersionInvalidationTests(PropertyCacheTestCase):
+
+    def test_invalidation_refreshes_list_and_per_id_keys(self):
+        property_obj = self.create_property('Old title')
+
+        self.assertEqual(utils.get_all_properties()[0]['title'], 'Old title')
+        self.assertEqual(utils.get_property_by_id(property_obj.pk)['title'], 'Old title')
+        self.assertEqual(utils.get_properties_by_ids([property_obj.pk])[0]['title'], 'Old title')
+
+        # queryset.update() sends no signals, so the caches are still stale
+        Property.objects.filter(pk=property_obj.pk).update(title='New title')
+        self.assertEqual(utils.get_all_properties()[0]['title'], 'Old title')
+        self.assertEqual(utils.get_property_by_id(property_obj.pk)['title'], 'Old title')
+
+        version = utils._cache_version()
+        utils.invalidate_properties_cache()
+
+        self.assertEqual(utils._cache_version(), version + 1)
+        self.assertEqual(utils.get_all_properties()[0]['title'], 'New title')
+        self.assertEqual(utils.get_property_by_id(property_obj.pk)['title'], 'New title')
+        self.assertEqual(utils.get_properties_by_ids([property_obj.pk])[0]['title'], 'New title')
+
+    def test_invalidation_refreshes_list_snapshot(self):
+        self.create_property('First')
+        snapshot = utils.get_property_list_snapshot()
+
+        self.create_property('Second')
+        self.assertEqual(utils.get_property_list_snapshot(), snapshot)
+
+        utils.invalidate_properties_cache()
+        new_snapshot = utils.get_property_list_snapshot()
+
+        self.assertNotEqual(new_snapshot['etag'], snapshot['etag'])
+        self.assertEqual(orjson.loads(new_snapshot['json'])['count'], 2)
+        self.assertEqual(gzip.decompress(new_snapshot['gzip']), new_snapshot['json'])
+
+
+class PropertiesPageTests(PropertyCacheTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.newest = self.create_property('Newest', minutes_ago=1)
+        self.middle = self.create_property('Middle', minutes_ago=2)
+        self.oldest = self.create_property('Oldest', minutes_ago=3)
+
+    def assertPage(self, page, titles, total, offset, limit):
+        data = orjson.loads(page)
+        self.assertEqual([row['title'] for row in data['properties']], titles)
+        self.assertEqual(data['count'], len(titles))
+        self.assertEqual(data['total'], total)
+        self.assertEqual(data['offset'], offset)
+        self.assertEqual(data['limit'], limit)
+
+    def test_page_on_cache_miss_and_hit(self):
+        # First call builds the sorted set, the second reads it
+        self.assertPage(utils.get_properties_page(0, 2), ['Newest', 'Middle'], 3, 0, 2)
+
+        with mock.patch.object(utils, 'get_all_properties') as get_all_properties:
+            self.assertPage(utils.get_properties_page(0, 2), ['Newest', 'Middle'], 3, 0, 2)
+            self.assertPage(utils.get_properties_page(2, 2), ['Oldest'], 3, 2, 2)
+            get_all_properties.assert_not_called()
+
+    def test_page_rows_match_list_rows(self):
+        page = orjson.loads(utils.get_properties_page(0, 20))
+
+        self.assertEqual(page['properties'], utils.get_all_properties())
+
+    def test_offset_past_the_end(self):
+        utils.get_properties_page()
+
+        self.assertPage(utils.get_properties_page(10, 5), [], 3, 10, 5)
+
+    def test_empty_listing_is_cached(self):
+        Property.objects.all().delete()
+        utils.invalidate_properties_cache()
+
+        self.assertPage(utils.get_properties_page(), [], 0, 0, 20)
+
+        with mock.patch.object(utils, 'get_all_properties') as get_all_properties:
+            self.assertPage(utils.get_properties_page(), [], 0, 0, 20)
+            get_all_properties.assert_not_called()
+
+
+class PropertyListConditionalGetTests(PropertyCacheTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.factory = RequestFactory()
+        self.create_property('Riad')
+
+    def test_plain_response_and_304(self):
+        response = views.property_list(self.factory.get('/properties/'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(orjson.loads(response.content)['count'], 1)
+        self.assertEqual(response['Content-Length'], str(len(response.content)))
+        etag = response['ETag']
+        self.assertFalse(etag.startswith('W/'))
+
+        not_modified = views.property_list(
+            self.factory.get('/properties/', HTTP_IF_NONE_MATCH=etag)
+        )
+
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], etag)
+        self.assertIn('Accept-Encoding', not_modified['Vary'])
+
+    def test_gzip_response_and_304(self):
+        plain = views.property_list(self.factory.get('/properties/'))
+        response = views.property_list(
+            self.factory.get('/properties/', HTTP_ACCEPT_ENCODING='gzip, deflate')
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        etag = response['ETag']
+        self.assertEqual(etag, f'W/{plain["ETag"]}')
+
+        not_modified = views.property_list(self.factory.get(
+            '/properties/', HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=etag
+        ))
+
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], etag)
+        self.assertIn('Accept-Encoding', not_modified['Vary'])
+
+    def test_stale_etag_gets_full_response(self):
+        etag = views.property_list(self.factory.get('/properties/'))['ETag']
+
+        self.create_property('Kasbah')
+        utils.invalidate_properties_cache()
+        response = views.property_list(
+            self.factory.get('/properties/', HTTP_IF_NONE_MATCH=etag)
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(orjson.loads(response.content)['count'], 2)
+
+
+class SignalInvalidationTests(PropertyCacheTestCase):
+
+    @mock.patch('properties.signals.invalidate_properties_cache')
+    def test_one_invalidation_per_atomic_block(self, invalidate):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                property_obj = self.create_property('Villa')
+                property_obj.title = 'Villa with pool'
+                property_obj.save()
+                self.create_property('Apartment').delete()
+
+        self.assertEqual(invalidate.call_count, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.create_property('Studio')
+
+        self.assertEqual(invalidate.call_count, 2)
+
+    @mock.patch('properties.signals.invalidate_properties_cache')
+    def test_rolled_back_savepoint_still_invalidates(self, invalidate):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                try:
+                    with transaction.atomic():
+                        self.create_property('Rolled back')
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+                self.create_property('Kept')
+
+        self.assertEqual(invalidate.call_count, 1)
@@ -7,6 +7,9 @@ urlpatterns = [
     # Main property list endpoint
     path('', views.property_list, name='property_list'),
     
+    # Paginated property list served from the Redis sorted set
+    path('page/', views.property_list_page, name='property_list_page'),
+    
     # Optional HTML version
     path('html/', views.property_list_html, name='property_list_html'),
     
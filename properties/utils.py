@@ -3,10 +3,196 @@
 from django.core.cache import cache
 from django_redis import get_redis_connection
 from .models import Property
+import cachetools
+import functools
+import gzip
+import hashlib
 import logging
+import orjson
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Fields cached for each property row
+PROPERTY_FIELDS = ('id', 'title', 'description', 'price', 'location', 'created_at')
+
+# Shared Redis client, created lazily on first use
+_redis_client = None
+
+# Key holding the current property cache version. Every property key is
+# written under this version, so bumping it invalidates them all at once.
+CACHE_VERSION_KEY = 'properties_cache_version'
+
+# Short-lived in-process cache for monitoring results, keyed by function name.
+# TTLCache is not thread-safe, so access goes through _monitoring_cache_lock.
+_monitoring_cache = cachetools.TTLCache(maxsize=4, ttl=1.0)
+_monitoring_cache_lock = threading.Lock()
+
+# In-process (L1) cache in front of Redis for the hottest payloads, as
+# {key: (value, stored_at)}. The short TTL bounds how long other
+# processes may serve data after an invalidation.
+LOCAL_CACHE_TTL = 2
+_local_cache = {}
+
+
+def _get_redis():
+    """
+    Return the shared Redis client backed by django-redis' connection pool.
+    
+    The client is resolved once per process so callers reuse pooled
+    connections instead of looking the connection up on every call.
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = get_redis_connection("default")
+    return _redis_client
+
+
+def _local_get(key):
+    """
+    Return a value from the in-process cache, or None if missing or expired.
+    """
+    value, stored_at = _local_cache.get(key, (None, 0.0))
+    if time.monotonic() - stored_at < LOCAL_CACHE_TTL:
+        return value
+    return None
+
+
+def _local_set(key, value):
+    """
+    Store a value in the in-process cache, pruning expired entries.
+    
+    Pruning keeps entries for superseded cache versions from piling up.
+    """
+    now = time.monotonic()
+    
+    for stale_key, (_, stored_at) in list(_local_cache.items()):
+        if now - stored_at >= LOCAL_CACHE_TTL:
+            _local_cache.pop(stale_key, None)
+    
+    _local_cache[key] = (value, now)
+
+
+def _cache_version():
+    """
+    Return the current property cache version.
+    
+    The version is kept in the in-process cache for LOCAL_CACHE_TTL
+    seconds to avoid an extra Redis GET on every lookup. It defaults to 0
+    so the first INCR moves readers off any existing entries.
+    """
+    version = _local_get(CACHE_VERSION_KEY)
+    
+    if version is None:
+        version = cache.get(CACHE_VERSION_KEY, 0)
+        _local_set(CACHE_VERSION_KEY, version)
+    
+    return version
+
+
+def _monitoring_memoize(func):
+    """
+    Memoize a zero-argument monitoring helper in _monitoring_cache.
+    
+    Concurrent callers are coalesced: the first one computes the result
+    while holding the function's lock and the others reuse it, so frequent
+    polling does not hit Redis on every call.
+    """
+    lock = threading.Lock()
+    
+    @functools.wraps(func)
+    def wrapper():
+        with lock:
+            with _monitoring_cache_lock:
+                result = _monitoring_cache.get(func.__name__)
+            
+            if result is None:
+                result = func()
+                with _monitoring_cache_lock:
+                    _monitoring_cache[func.__name__] = result
+            
+            return result
+    
+    return wrapper
+
+
+def _to_cache_row(row):
+    """
+    Convert a .values() row into a msgpack-friendly dict.
+    
+    msgpack cannot encode Decimal or datetime, so both are stored as strings.
+    """
+    row['price'] = str(row['price'])
+    row['created_at'] = row['created_at'].isoformat()
+    return row
+
+
+def _fetch_all_properties():
+    """
+    Fetch all properties from the database as cache-ready dicts.
+    """
+    queryset = Property.objects.order_by('-created_at').values(*PROPERTY_FIELDS)
+    
+    # Stream rows in chunks instead of filling the queryset result cache,
+    # converting them to plain dicts that msgpack can serialize
+    return [_to_cache_row(row) for row in queryset.iterator(chunk_size=2000)]
+
+
+def _get_or_rebuild(cache_key, build, version):
+    """
+    Read ``cache_key``, rebuilding it under a lock on a miss.
+    
+    Only the caller that wins cache.add() on '<cache_key>_lock' (SET NX,
+    30s expiry) runs ``build``; concurrent callers poll the cache for up to
+    ~1 second instead of all rebuilding at once, then fall back to an
+    uncached build.
+    
+    Args:
+        cache_key (str): Key to read and rebuild
+        build (callable): Returns a dict of entries to cache for 1 hour,
+            including ``cache_key`` itself
+        version (int): Property cache version to read and write under
+        
+    Returns:
+        The cached or rebuilt value of ``cache_key``
+    """
+    lock_key = f'{cache_key}_lock'
+    
+    # Step 1: Try to get data from cache
+    cached_value = cache.get(cache_key, version=version)
+    
+    if cached_value is not None:
+        logger.info(f"Cache HIT for key: {cache_key}")
+        return cached_value
+    
+    # Step 2: Cache miss - only the lock holder rebuilds
+    if not cache.add(lock_key, 1, 30, version=version):
+        logger.info(f"Cache MISS for key: {cache_key} - waiting for rebuild")
+        
+        # Wait up to ~1 second for the lock holder to fill the cache
+        for _ in range(20):
+            time.sleep(0.05)
+            cached_value = cache.get(cache_key, version=version)
+            if cached_value is not None:
+                return cached_value
+        
+        logger.warning(f"Timed out waiting for {cache_key} - building without caching")
+        return build()[cache_key]
+    
+    try:
+        logger.info(f"Cache MISS for key: {cache_key} - rebuilding")
+        
+        entries = build()
+        
+        # Step 3: Store in cache for 1 hour (3600 seconds)
+        cache.set_many(entries, 3600, version=version)
+        logger.info(f"Cached {', '.join(entries)} for 1 hour")
+    finally:
+        cache.delete(lock_key, version=version)
+    
+    return entries[cache_key]
+
 
 def get_all_properties():
     """
@@ -14,49 +200,228 @@ def get_all_properties():
     
     This function implements a cache-aside pattern:
     1. Check Redis cache for 'all_properties' key
-    2. If found, return cached queryset
-    3. If not found, fetch from database
+    2. If found, return cached rows
+    3. If not found, take the rebuild lock and fetch from database
     4. Store in cache for 1 hour (3600 seconds)
-    5. Return the queryset
+    5. Return the rows
+    
+    Only the worker holding the 'all_properties_lock' key rebuilds the
+    cache; concurrent callers wait briefly for it instead of all querying
+    the database at once.
+    
+    Rows are plain dicts (price and created_at as strings) so the cache
+    can use the msgpack serializer instead of pickling model instances.
     
     Returns:
-        QuerySet: All Property objects ordered by creation date (newest first)
+        list: Property dicts ordered by creation date (newest first)
     """
-    cache_key = 'all_properties'
+    def build():
+        properties_list = _fetch_all_properties()
+        
+        # Store the row count too so stats can be reported without
+        # loading the whole list
+        return {
+            'all_properties': properties_list,
+            'all_properties_count': len(properties_list),
+        }
     
-    # Step 1: Try to get data from cache
-    cached_properties = cache.get(cache_key)
+    return _get_or_rebuild('all_properties', build, _cache_version())
+
+
+def _build_property_list_snapshot(properties_list):
+    """
+    Serialize property rows into the list endpoint's response snapshot.
     
-    if cached_properties is not None:
-        logger.info(f"Cache HIT for key: {cache_key}")
-        return cached_properties
+    The JSON body, its gzip-compressed form and the ETag are built together
+    so they always describe the same data.
+    """
+    payload = orjson.dumps({
+        'properties': properties_list,
+        'count': len(properties_list),
+        'cached': True,
+        'cache_info': {
+            'queryset_cache_duration': '1 hour',
+        },
+    })
+    
+    return {
+        'json': payload,
+        'gzip': gzip.compress(payload, compresslevel=6),
+        'etag': hashlib.sha1(payload).hexdigest(),
+    }
+
+
+def get_property_list_snapshot():
+    """
+    Retrieve the pre-serialized response snapshot for the property list.
+    
+    The snapshot holds the JSON body, the gzip-compressed body and the ETag
+    of the same payload, stored as one entry under 'all_properties_response'
+    so they can never be mixed across cache generations. Cache hits skip
+    the per-row dict construction, JSON encoding and compression entirely,
+    and on a miss only one worker rebuilds it.
+    Recent snapshots are also kept in process memory for LOCAL_CACHE_TTL
+    seconds, keyed by cache version, so most requests avoid the Redis
+    round trip.
+    
+    Returns:
+        dict: 'json' (bytes), 'gzip' (bytes) and 'etag' (str)
+    """
+    cache_key = 'all_properties_response'
+    version = _cache_version()
+    local_key = f'{cache_key}:{version}'
+    
+    # Serve from the in-process cache first, then Redis
+    snapshot = _local_get(local_key)
+    
+    if snapshot is not None:
+        return snapshot
+    
+    # On a miss only the lock holder serializes and compresses the
+    # payload, reusing the cached rows (price and created_at are strings)
+    snapshot = _get_or_rebuild(
+        cache_key,
+        lambda: {cache_key: _build_property_list_snapshot(get_all_properties())},
+        version,
+    )
+    
+    _local_set(local_key, snapshot)
+    
+    return snapshot
+
+
+def get_all_properties_json():
+    """
+    Retrieve the property list as a pre-serialized JSON payload.
+    
+    Returns:
+        bytes: JSON-encoded property list ready to be sent to the client
+    """
+    return get_property_list_snapshot()['json']
+
+
+def get_all_properties_json_gzip():
+    """
+    Retrieve the gzip-compressed property list JSON payload.
+    
+    Returns:
+        bytes: gzip-compressed JSON payload
+    """
+    return get_property_list_snapshot()['gzip']
+
+
+def _store_properties_zset(properties_list, version):
+    """
+    Store property rows in the 'all_properties_zset' sorted set.
+    
+    Each member is a row's JSON encoding scored by its position in the
+    newest-first listing, so pages can be read with ZRANGE. The row count
+    is stored under 'all_properties_zset_total' so an empty listing still
+    counts as cached. Everything is written in one MULTI/EXEC so readers
+    never see a half-written set.
+    """
+    zset_key = cache.make_key('all_properties_zset', version=version)
+    total_key = cache.make_key('all_properties_zset_total', version=version)
+    
+    with _get_redis().pipeline(transaction=True) as pipe:
+        pipe.delete(zset_key)
+        if properties_list:
+            pipe.zadd(zset_key, {
+                orjson.dumps(row): position
+                for position, row in enumerate(properties_list)
+            })
+            pipe.expire(zset_key, 3600)
+        pipe.set(total_key, len(properties_list), ex=3600)
+        pipe.execute()
+
+
+def get_properties_page(offset=0, limit=20):
+    """
+    Retrieve one page of the property list as a JSON payload.
     
-    # Step 2: Cache miss - fetch from database
-    logger.info(f"Cache MISS for key: {cache_key} - fetching from database")
+    Rows are read from the 'all_properties_zset' sorted set with ZRANGE,
+    so only the requested page is transferred and no rows are decoded;
+    the JSON fragments are joined into the response envelope as-is.
     
-    # Fetch all properties from database
-    queryset = Property.objects.all().order_by('-created_at')
+    Args:
+        offset (int): Index of the first property to return
+        limit (int): Maximum number of properties to return
+        
+    Returns:
+        bytes: JSON-encoded page of properties
+    """
+    cache_key = 'all_properties_zset'
+    version = _cache_version()
+    zset_key = cache.make_key(cache_key, version=version)
+    total_key = cache.make_key('all_properties_zset_total', version=version)
     
-    # Convert queryset to list to make it serializable for cache
-    properties_list = list(queryset)
+    with _get_redis().pipeline(transaction=True) as pipe:
+        pipe.zrange(zset_key, offset, offset + limit - 1)
+        pipe.zcard(zset_key)
+        pipe.get(total_key)
+        members, size, total = pipe.execute()
     
-    # Step 3: Store in cache for 1 hour (3600 seconds)
-    cache.set(cache_key, properties_list, 3600)
-    logger.info(f"Cached {len(properties_list)} properties for 1 hour")
+    # The set is only usable if its stored total matches its size, which
+    # also covers an empty listing (no set, total of 0)
+    if total is not None and int(total) == size:
+        logger.info(f"Cache HIT for key: {cache_key}")
+        total = size
+    else:
+        logger.info(f"Cache MISS for key: {cache_key} - building from property rows")
+        
+        properties_list = get_all_properties()
+        
+        # Only one worker writes the sorted set; others serve from the rows
+        lock_key = 'all_properties_zset_lock'
+        if cache.add(lock_key, 1, 30, version=version):
+            try:
+                _store_properties_zset(properties_list, version)
+            finally:
+                cache.delete(lock_key, version=version)
+        
+        members = [orjson.dumps(row) for row in properties_list[offset:offset + limit]]
+        total = len(properties_list)
     
-    return properties_list
+    return b''.join([
+        b'{"properties":[',
+        b','.join(members),
+        b'],',
+        orjson.dumps({
+            'count': len(members),
+            'total': total,
+            'offset': offset,
+            'limit': limit,
+        })[1:],
+    ])
+
+
+def get_all_properties_etag():
+    """
+    Get the ETag of the cached property list JSON payload.
+    
+    Used for conditional GET handling so clients with a fresh copy get a
+    304 response without the payload being sent again.
+    
+    Returns:
+        str: SHA-1 hex digest of the JSON payload
+    """
+    return get_property_list_snapshot()['etag']
 
 
 def invalidate_properties_cache():
     """
-    Invalidate the all_properties cache.
+    Invalidate every cached property key by bumping the cache version.
     
     This function should be called when properties are created, updated, or deleted
-    to ensure cache consistency.
+    to ensure cache consistency. A single INCR moves readers to a new key
+    namespace; entries under the old version simply expire with their TTL.
     """
-    cache_key = 'all_properties'
-    cache.delete(cache_key)
-    logger.info(f"Invalidated cache for key: {cache_key}")
+    version = _get_redis().incr(cache.make_key(CACHE_VERSION_KEY))
+    
+    # Drop this process' copies too; other processes expire within
+    # LOCAL_CACHE_TTL seconds
+    _local_cache.clear()
+    logger.info(f"Invalidated property caches, now at version {version}")
 
 
 def get_property_by_id(property_id):
@@ -67,12 +432,13 @@ def get_property_by_id(property_id):
         property_id (int): The ID of the property to retrieve
         
     Returns:
-        Property: The property object or None if not found
+        dict: The property data or None if not found
     """
     cache_key = f'property_{property_id}'
     
     # Try to get from cache first
-    cached_property = cache.get(cache_key)
+    version = _cache_version()
+    cached_property = cache.get(cache_key, version=version)
     
     if cached_property is not None:
         logger.info(f"Cache HIT for property ID: {property_id}")
@@ -80,33 +446,84 @@ def get_property_by_id(property_id):
     
     # Cache miss - fetch from database
     try:
-        property_obj = Property.objects.get(id=property_id)
+        property_data = _to_cache_row(
+            Property.objects.values(*PROPERTY_FIELDS).get(id=property_id)
+        )
         
         # Cache for 30 minutes (1800 seconds)
-        cache.set(cache_key, property_obj, 1800)
+        cache.set(cache_key, property_data, 1800, version=version)
         logger.info(f"Cached property ID: {property_id} for 30 minutes")
         
-        return property_obj
+        return property_data
     except Property.DoesNotExist:
         logger.warning(f"Property with ID {property_id} not found")
         return None
 
 
+def get_properties_by_ids(property_ids):
+    """
+    Get several properties by ID with caching, in batched lookups.
+    
+    Uses one cache round trip for all IDs and a single database query for
+    the ones not cached, instead of one lookup per ID.
+    
+    Args:
+        property_ids (iterable): IDs of the properties to retrieve
+        
+    Returns:
+        list: Property dicts in the order of property_ids, skipping IDs
+        that do not exist
+    """
+    cache_keys = {property_id: f'property_{property_id}' for property_id in property_ids}
+    
+    # Fetch all cached properties in one round trip
+    version = _cache_version()
+    cached = cache.get_many(cache_keys.values(), version=version)
+    logger.info(f"Cache HIT for {len(cached)} of {len(cache_keys)} property IDs")
+    
+    missing_ids = [
+        property_id for property_id, key in cache_keys.items() if key not in cached
+    ]
+    
+    if missing_ids:
+        # Cache miss - fetch all missing properties in a single query
+        fetched = {
+            f'property_{row["id"]}': _to_cache_row(row)
+            for row in Property.objects.filter(id__in=missing_ids).values(*PROPERTY_FIELDS)
+        }
+        
+        # Cache for 30 minutes (1800 seconds)
+        cache.set_many(fetched, 1800, version=version)
+        logger.info(f"Cached {len(fetched)} properties for 30 minutes")
+        
+        cached.update(fetched)
+    
+    return [cached[key] for key in cache_keys.values() if key in cached]
+
+
+@_monitoring_memoize
 def get_cache_stats():
     """
     Get cache statistics for monitoring purposes.
     
+    Uses EXISTS and the stored row count rather than loading the cached
+    list. Results are memoized for 1 second.
+    
     Returns:
         dict: Cache statistics including hit/miss info
     """
     cache_key = 'all_properties'
     
-    # Check if cache exists
-    cached_data = cache.get(cache_key)
+    # Check if cache exists without deserializing it
+    version = _cache_version()
+    is_cached = cache.has_key(cache_key, version=version)
     
     stats = {
-        'all_properties_cached': cached_data is not None,
-        'all_properties_count': len(cached_data) if cached_data else 0,
+        'all_properties_cached': is_cached,
+        'all_properties_count': (
+            cache.get('all_properties_count', 0, version=version) if is_cached else 0
+        ),
+        'cache_version': version,
         'cache_key': cache_key,
         'cache_timeout': 3600,  # 1 hour in seconds
     }
@@ -131,22 +548,24 @@ def warm_cache():
     return len(properties)
 
 
+@_monitoring_memoize
 def get_redis_cache_metrics():
     """
     Retrieve and analyze Redis cache hit/miss metrics.
     
     This function connects to Redis via django_redis and retrieves keyspace
-    statistics to calculate cache performance metrics.
+    statistics to calculate cache performance metrics. Results are memoized
+    for 1 second to cap INFO calls.
     
     Returns:
         dict: Dictionary containing cache metrics including hits, misses, and hit ratio
     """
     try:
-        # Get Redis connection using django_redis
-        redis_conn = get_redis_connection("default")
+        # Get the shared pooled Redis connection
+        redis_conn = _get_redis()
         
-        # Get Redis INFO statistics
-        info = redis_conn.info()
+        # Get only the stats section of Redis INFO, which holds the keyspace counters
+        info = redis_conn.info('stats')
         
         # Extract keyspace hits and misses
         keyspace_hits = info.get('keyspace_hits', 0)
@@ -1,57 +1,90 @@
 from django.shortcuts import render
-from django.http import JsonResponse
-from django.views.decorators.cache import cache_page
-from django.core import serializers
+from django.http import HttpResponse
 from django.utils import timezone
-from .models import Property
-from .utils import get_all_properties, get_cache_stats
-import json
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.dateparse import parse_datetime
+from .utils import (
+    get_all_properties,
+    get_cache_stats,
+    get_properties_page,
+    get_property_list_snapshot,
+)
+import orjson
+import re
+
+re_accepts_gzip = re.compile(r'\bgzip\b')
+
+def json_bytes_response(body, status=200):
+    """
+    Build a JSON response from already-encoded bytes with Content-Length set.
+    """
+    response = HttpResponse(body, content_type='application/json', status=status)
+    response['Content-Length'] = str(len(body))
+    return response
 
-@cache_page(60 * 15)  # Cache for 15 minutes
 def property_list(request):
     """
-    View to return all properties with caching enabled for 15 minutes.
-    Now uses low-level caching via get_all_properties() function.
-    Returns JSON response with all property data.
+    View to return all properties.
+    Serves the pre-serialized snapshot from get_property_list_snapshot()
+    so cache hits skip per-row conversion and JSON encoding.
+    Requests with a matching If-None-Match header get a 304 response, and
+    clients accepting gzip get the pre-compressed payload.
     """
-    # Get all properties using low-level caching
-    properties = get_all_properties()
+    use_gzip = bool(re_accepts_gzip.search(request.META.get('HTTP_ACCEPT_ENCODING', '')))
+    
+    # Read body and ETag from one snapshot so they always match
+    snapshot = get_property_list_snapshot()
     
-    # Convert to list of dictionaries for JSON serialization
-    properties_data = []
-    for property_obj in properties:
-        properties_data.append({
-            'id': property_obj.id,
-            'title': property_obj.title,
-            'description': property_obj.description,
-            'price': str(property_obj.price),  # Convert Decimal to string for JSON
-            'location': property_obj.location,
-            'created_at': property_obj.created_at.isoformat(),
-        })
+    # Compressed bodies get a weak ETag, as GZipMiddleware does
+    if use_gzip:
+        etag = f'W/"{snapshot["etag"]}"'
+    else:
+        etag = f'"{snapshot["etag"]}"'
     
-    # Get cache statistics
-    cache_stats = get_cache_stats()
+    response = get_conditional_response(request, etag=etag)
+    
+    if response is None:
+        if use_gzip:
+            response = json_bytes_response(snapshot['gzip'])
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = json_bytes_response(snapshot['json'])
+    
+    # Set validators on 200 and 304 responses alike
+    response['ETag'] = etag
+    patch_vary_headers(response, ('Accept-Encoding',))
+    
+    return response
+
+def property_list_page(request):
+    """
+    View to return one page of properties.
+    Accepts 'offset' and 'limit' query parameters (limit capped at 100)
+    and serves the page straight from the Redis sorted set.
+    """
+    try:
+        offset = max(int(request.GET.get('offset', 0)), 0)
+        limit = min(max(int(request.GET.get('limit', 20)), 1), 100)
+    except ValueError:
+        return json_bytes_response(
+            orjson.dumps({'error': 'offset and limit must be integers'}), status=400
+        )
     
-    # Return JSON response
-    return JsonResponse({
-        'properties': properties_data,
-        'count': len(properties_data),
-        'cached': True,  # Indicator that this view uses caching
-        'cache_info': {
-            'view_cache_duration': '15 minutes',
-            'queryset_cache_duration': '1 hour',
-            'low_level_cache_active': cache_stats['all_properties_cached']
-        }
-    })
+    return json_bytes_response(get_properties_page(offset, limit))
 
 # Alternative HTML view (optional)
-@cache_page(60 * 15)
 def property_list_html(request):
     """
     HTML version of property list view with caching.
     Now uses low-level caching via get_all_properties() function.
+    The cached rows are plain dicts, which the template reads directly
+    without rebuilding Property instances. created_at is cached as an ISO
+    string, so it is parsed back for localized date rendering.
     """
-    properties = get_all_properties()
+    properties = [
+        {**row, 'created_at': parse_datetime(row['created_at'])}
+        for row in get_all_properties()
+    ]
     
     context = {
         'properties': properties,
@@ -67,10 +100,10 @@ def cache_stats(request):
     """
     stats = get_cache_stats()
     
-    return JsonResponse({
+    return json_bytes_response(orjson.dumps({
         'cache_statistics': stats,
         'timestamp': str(timezone.now()),
-    })
+    }))
 
 # New view to manually warm cache
 def warm_cache_view(request):
@@ -83,8 +116,8 @@ def warm_cache_view(request):
     
     count = warm_cache()
     
-    return JsonResponse({
+    return json_bytes_response(orjson.dumps({
         'message': 'Cache warmed up successfully',
         'properties_cached': count,
         'timestamp': str(timezone.now()),
-    })
\ No newline at end of file
+    }))
\ No newline at end of file